@@ -0,0 +1,143 @@
+"""
+Startup-time regression benchmark.
+
+Checks the costs a real invocation pays, each in fresh processes:
+
+- importing the CLI must not pull in anything that should load lazily
+  (pikepdf, the checker and check modules, XML parsing, report writing);
+- importing the checker and check modules, with pikepdf already loaded,
+  must stay within --import-budget-ms, so a heavy import added to
+  checker.py or checks/* shows up even though pikepdf dominates;
+- checking one small PDF end to end must stay within --pikepdf-budget-ms
+  and --catalog-budget-ms for the two backends.
+
+Most of a pikepdf run is spent importing pikepdf itself; `--backend catalog`
+is the fast path for hooks and CI that only need the catalog checks.
+
+Usage:
+    python benchmarks/importtime.py [--runs 5] [--import-budget-ms 15]
+        [--pikepdf-budget-ms 250] [--catalog-budget-ms 80]
+"""
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PACKAGE = "manual_pdf_accessibility_checker"
+CHECK_MODULES = [f"{PACKAGE}.checker", f"{PACKAGE}.checks.page"]
+
+# Modules that must not be imported just by loading the CLI
+LAZY_MODULES = {
+    "pikepdf",
+    "argparse",
+    f"{PACKAGE}.checker",
+    f"{PACKAGE}.checks.document",
+    f"{PACKAGE}.checks.page",
+    f"{PACKAGE}.report",
+    "xml.etree.ElementTree",
+    "csv",
+    "json",
+}
+
+
+def measure_imports(statement):
+    """Run statement under -X importtime in a fresh interpreter; return [(module, cumulative_us, top_level)]."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        cwd=REPO_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    modules = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        # Nested imports are indented (beyond the one separator space) under
+        # the import that triggered them
+        modules.append((name.strip(), int(cumulative), not name.startswith("  ")))
+    return modules
+
+def check_module_import_ms(runs):
+    """Best-of-runs time to import the checker and check modules, with pikepdf preloaded."""
+    statement = "import pikepdf; " + "; ".join(f"import {m}" for m in CHECK_MODULES)
+    times = []
+    for _ in range(runs):
+        modules = measure_imports(statement)
+        # Top-level entries only, so nested modules aren't counted twice
+        times.append(sum(
+            cumulative for name, cumulative, top_level in modules
+            if top_level and name.startswith(PACKAGE)
+        ))
+    return min(times) / 1000
+
+def write_small_pdf(path):
+    """Write a minimal one-page PDF with correct xref offsets."""
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R /Lang (en-US) >>",
+        b"<< /Type /Pages /Kids [3 0 R] /Count 1 >>",
+        b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] >>",
+    ]
+    out = bytearray(b"%PDF-1.7\n")
+    offsets = []
+    for num, body in enumerate(objects, start=1):
+        offsets.append(len(out))
+        out += b"%d 0 obj\n" % num + body + b"\nendobj\n"
+    xref = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    for offset in offsets:
+        out += b"%010d 00000 n \n" % offset
+    out += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref)
+    with open(path, "wb") as f:
+        f.write(out)
+
+def end_to_end_ms(pdf_path, backend, runs):
+    """Best-of-runs wall time for `check_pdf.py --backend <backend> <pdf>` in a fresh process."""
+    command = [sys.executable, os.path.join(REPO_ROOT, "check_pdf.py"), "--backend", backend, pdf_path]
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run(command, stdout=subprocess.DEVNULL, check=True)
+        times.append(time.perf_counter() - start)
+    return min(times) * 1000
+
+def main():
+    parser = argparse.ArgumentParser(description="Check that CLI startup stays fast.")
+    parser.add_argument("--runs", type=int, default=5, help="Number of fresh-process runs per measurement; the fastest is reported.")
+    parser.add_argument("--import-budget-ms", type=float, default=15.0, help="Maximum time to import the checker and check modules, excluding pikepdf.")
+    parser.add_argument("--pikepdf-budget-ms", type=float, default=250.0, help="Maximum end-to-end time to check a small PDF with the pikepdf backend.")
+    parser.add_argument("--catalog-budget-ms", type=float, default=80.0, help="Maximum end-to-end time to check a small PDF with the catalog backend.")
+    args = parser.parse_args()
+
+    failed = False
+
+    cli_modules = {name for name, _, _ in measure_imports(f"import {PACKAGE}.cli")}
+    eager = sorted(LAZY_MODULES.intersection(cli_modules))
+    if eager:
+        print(f"FAIL: imported by the CLI at startup but should be lazy: {', '.join(eager)}")
+        failed = True
+
+    import_ms = check_module_import_ms(args.runs)
+    print(f"checker and check modules import: {import_ms:.2f} ms (budget {args.import_budget_ms} ms)")
+    if import_ms > args.import_budget_ms:
+        print("FAIL: check module imports over budget")
+        failed = True
+
+    with tempfile.TemporaryDirectory() as tmp:
+        pdf_path = os.path.join(tmp, "small.pdf")
+        write_small_pdf(pdf_path)
+        for backend, budget in (("pikepdf", args.pikepdf_budget_ms), ("catalog", args.catalog_budget_ms)):
+            elapsed = end_to_end_ms(pdf_path, backend, args.runs)
+            print(f"check_pdf.py --backend {backend} small.pdf: {elapsed:.1f} ms (budget {budget} ms)")
+            if elapsed > budget:
+                print(f"FAIL: {backend} end-to-end time over budget")
+                failed = True
+
+    sys.exit(1 if failed else 0)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,6 @@
+"""
+Manual PDF accessibility checker.
+
+Importing the package is kept cheap: pikepdf and the check modules are only
+loaded once a PDF is actually checked (see checker.py).
+"""
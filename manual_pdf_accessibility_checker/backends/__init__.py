@@ -0,0 +1,24 @@
+"""
+Parser backends the checks run against.
+
+Backends are imported on demand, so the catalog-only reader never loads
+pikepdf.
+"""
+from importlib import import_module
+
+from .base import Backend, BackendError
+
+__all__ = ["BACKENDS", "Backend", "BackendError", "open_backend"]
+
+# Backend name -> (module, class)
+BACKENDS = {
+    "pikepdf": (".pikepdf_backend", "PikepdfBackend"),
+    "catalog": (".catalog", "CatalogReader"),
+}
+
+
+def open_backend(name, file_path):
+    """Open file_path with the named backend."""
+    module_name, class_name = BACKENDS[name]
+    module = import_module(module_name, __name__)
+    return getattr(module, class_name)(file_path)
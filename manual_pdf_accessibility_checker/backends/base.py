@@ -0,0 +1,42 @@
+from abc import ABC, abstractmethod
+
+
+class BackendError(Exception):
+    """Raised when a backend can't read a PDF (or part of one) it was asked for."""
+
+
+class Backend(ABC):
+    """
+    The document interface the checks run against.
+
+    Backends expose the document with the same dictionary-style access as
+    pikepdf, so a check written against one works on the other:
+
+    - `Root`: the document catalog (`"/Lang" in pdf.Root`, `pdf.Root.Outlines`, ...)
+    - `docinfo`: the trailer /Info dictionary, or an empty dict
+    - `page_count`: the number of pages
+
+    Backends with `catalog_only = True` don't provide `pages` or object
+    identities (`objgen`), so only checks that stay within the catalog
+    (Tagged, Language, Title, Bookmarks) can run against them.
+    """
+
+    catalog_only = False
+
+    @property
+    @abstractmethod
+    def Root(self):
+        """The document catalog."""
+
+    @property
+    @abstractmethod
+    def docinfo(self):
+        """The trailer /Info dictionary, or an empty dict."""
+
+    @property
+    @abstractmethod
+    def page_count(self):
+        """The number of pages."""
+
+    def close(self):
+        pass
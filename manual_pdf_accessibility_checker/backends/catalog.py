@@ -0,0 +1,616 @@
+import mmap
+import re
+import zlib
+
+from .base import Backend, BackendError
+
+# PDF whitespace and comments
+_WS_RE = re.compile(rb"(?:[\x00\t\n\x0c\r ]+|%[^\r\n]*)*")
+# A run of regular (non-whitespace, non-delimiter) characters
+_TOKEN_RE = re.compile(rb"[^\x00\t\n\x0c\r ()<>\[\]{}/%]+")
+_REF_RE = re.compile(rb"(\d+)[\x00\t\n\x0c\r ]+(\d+)[\x00\t\n\x0c\r ]+R(?![^\x00\t\n\x0c\r ()<>\[\]{}/%])")
+# A run of references, e.g. a page tree's /Kids, parsed in one go
+_REF_RUN_RE = re.compile(rb"(?:[\x00\t\n\x0c\r ]*\d+[\x00\t\n\x0c\r ]+\d+[\x00\t\n\x0c\r ]+R(?![^\x00\t\n\x0c\r ()<>\[\]{}/%]))+")
+_REF_PAIR_RE = re.compile(rb"(\d+)[\x00\t\n\x0c\r ]+(\d+)[\x00\t\n\x0c\r ]+R")
+_OBJ_HEADER_RE = re.compile(rb"[\x00\t\n\x0c\r ]*(\d+)[\x00\t\n\x0c\r ]+(\d+)[\x00\t\n\x0c\r ]+obj")
+_INT_PAIR_RE = re.compile(rb"(\d+)[\x00\t\n\x0c\r ]+(\d+)")
+_XREF_ENTRY_RE = re.compile(rb"(\d{10}) (\d{5}) ([nf])")
+_STARTXREF_RE = re.compile(rb"startxref[\x00\t\n\x0c\r ]+(\d+)")
+_HEX_DIGITS_RE = re.compile(rb"[^0-9A-Fa-f]")
+
+_STRING_ESCAPES = {
+    ord("n"): b"\n", ord("r"): b"\r", ord("t"): b"\t", ord("b"): b"\b",
+    ord("f"): b"\f", ord("("): b"(", ord(")"): b")", ord("\\"): b"\\",
+}
+
+# Where PDFDocEncoding differs from Latin-1
+_PDFDOC_TO_UNICODE = dict(zip(
+    list(range(0x18, 0x20)) + list(range(0x80, 0x9F)) + [0xA0],
+    "\u02d8\u02c7\u02c6\u02d9\u02dd\u02db\u02da\u02dc"
+    "\u2022\u2020\u2021\u2026\u2014\u2013\u0192\u2044\u2039\u203a\u2212\u2030"
+    "\u201e\u201c\u201d\u2018\u2019\u201a\u2122\ufb01\ufb02\u0141\u0152\u0160"
+    "\u0178\u017d\u0131\u0142\u0153\u0161\u017e"
+    "\u20ac",
+))
+
+# Lookup result for a free (deleted) xref entry; stops the search through
+# older sections, which may still list the object
+_FREE = object()
+# Placeholder for an object that is being read, to detect reference cycles
+_READING = object()
+
+# Each classic xref entry is exactly 20 bytes, which lets us index into a
+# subsection directly instead of parsing every entry
+_XREF_ENTRY_SIZE = 20
+
+
+class Ref:
+    """An unresolved indirect reference, e.g. `12 0 R`."""
+
+    __slots__ = ("num", "gen")
+
+    def __init__(self, num, gen):
+        self.num = num
+        self.gen = gen
+
+    def __repr__(self):
+        return f"{self.num} {self.gen} R"
+
+class PdfDict:
+    """
+    A PDF dictionary that resolves indirect references on access.
+
+    Supports the subset of pikepdf.Dictionary the document-level checks use:
+    `"/Key" in d`, `d["/Key"]`, `d.get("/Key")`, `d.Key`, `keys()`, `items()`.
+    As in pikepdf, a key whose value is null, or a reference to a missing or
+    deleted object, counts as absent.
+    """
+
+    def __init__(self, reader, raw):
+        self._reader = reader
+        self._raw = raw
+
+    def __contains__(self, key):
+        return key in self._raw and self._present(self._raw[key])
+
+    def _present(self, value):
+        if value is None:
+            return False
+        if isinstance(value, Ref):
+            return self._reader._exists(value.num)
+        return True
+
+    def __getitem__(self, key):
+        return self._reader.resolve(self._raw[key])
+
+    def __getattr__(self, name):
+        try:
+            return self["/" + name]
+        except KeyError:
+            raise AttributeError(name) from None
+
+    def __len__(self):
+        return len(self.keys())
+
+    def __iter__(self):
+        return iter(self.keys())
+
+    def get(self, key, default=None):
+        if key not in self:
+            return default
+        return self[key]
+
+    def keys(self):
+        return [key for key, value in self._raw.items() if self._present(value)]
+
+    def items(self):
+        return ((key, self[key]) for key in self.keys())
+
+    def __repr__(self):
+        inner = " ".join(f"{key} {value!r}" for key, value in self._raw.items())
+        return f"<< {inner} >>"
+
+class PdfStream(PdfDict):
+    """A stream object; only FlateDecode (or unfiltered) data can be read."""
+
+    def __init__(self, reader, raw, data):
+        super().__init__(reader, raw)
+        self._data = data
+
+    def read_bytes(self):
+        filters = self.get("/Filter")
+        params = self.get("/DecodeParms")
+        if filters is None:
+            return self._data
+        if isinstance(filters, str):
+            filters, params = [filters], [params]
+        elif not isinstance(params, list):
+            params = [params] * len(filters)
+        data = self._data
+        for name, param in zip(filters, params):
+            if name not in ("/FlateDecode", "/Fl"):
+                raise BackendError(f"unsupported stream filter {name}")
+            try:
+                data = zlib.decompress(data)
+            except zlib.error as e:
+                raise BackendError(f"bad FlateDecode stream: {e}") from None
+            if param is not None and param.get("/Predictor", 1) > 1:
+                data = _undo_predictor(data, param)
+        return data
+
+def _undo_predictor(data, params):
+    """
+    Undo PNG row predictors (Predictor >= 10), as used by xref streams.
+
+    Xref streams almost always use the Up filter on short rows, so None and
+    Up rows are handled a whole row at a time: each row is held as an int
+    and Up is a bytewise add done with masks (SWAR), without a Python-level
+    loop over bytes. Sub, Average and Paeth fall back to a per-byte loop.
+    """
+    predictor = params.get("/Predictor", 1)
+    if predictor < 10:
+        raise BackendError(f"unsupported predictor {predictor}")
+    colors = params.get("/Colors", 1)
+    bits = params.get("/BitsPerComponent", 8)
+    columns = params.get("/Columns", 1)
+    bpp = max(1, colors * bits // 8)
+    row_len = (colors * bits * columns + 7) // 8
+
+    high = int.from_bytes(b"\x80" * row_len, "big")
+    low = int.from_bytes(b"\x7f" * row_len, "big")
+
+    out = bytearray()
+    prev = 0
+    for start in range(0, len(data), row_len + 1):
+        kind = data[start]
+        raw = data[start + 1:start + 1 + row_len].ljust(row_len, b"\x00")
+        if kind == 0:
+            prev = int.from_bytes(raw, "big")
+        elif kind == 2:
+            cur = int.from_bytes(raw, "big")
+            # Add each byte of cur and prev mod 256, with no carry between bytes
+            prev = ((cur & low) + (prev & low)) ^ ((cur ^ prev) & high)
+        else:
+            prev = int.from_bytes(_undo_row_filter(kind, bytearray(raw), prev.to_bytes(row_len, "big"), bpp), "big")
+        out += prev.to_bytes(row_len, "big")
+    return bytes(out)
+
+def _undo_row_filter(kind, row, prev, bpp):
+    """Undo the Sub (1), Average (3) or Paeth (4) PNG filter on one row."""
+    for i in range(len(row)):
+        left = row[i - bpp] if i >= bpp else 0
+        up = prev[i]
+        if kind == 1:
+            row[i] = (row[i] + left) & 0xFF
+        elif kind == 3:
+            row[i] = (row[i] + (left + up) // 2) & 0xFF
+        elif kind == 4:
+            up_left = prev[i - bpp] if i >= bpp else 0
+            p = left + up - up_left
+            pa, pb, pc = abs(p - left), abs(p - up), abs(p - up_left)
+            nearest = left if pa <= pb and pa <= pc else up if pb <= pc else up_left
+            row[i] = (row[i] + nearest) & 0xFF
+        else:
+            raise BackendError(f"unknown PNG filter type {kind}")
+    return row
+
+def _decode_text(raw):
+    """Decode a PDF text string (UTF-16BE/UTF-8 with BOM, else PDFDocEncoding)."""
+    if raw.startswith(b"\xfe\xff"):
+        return raw[2:].decode("utf-16-be", errors="replace")
+    if raw.startswith(b"\xef\xbb\xbf"):
+        return raw[3:].decode("utf-8", errors="replace")
+    return raw.decode("latin-1").translate(_PDFDOC_TO_UNICODE)
+
+
+class _ClassicXref:
+    """One classic `xref` table section, indexed by subsection without parsing entries."""
+
+    def __init__(self, buf, pos):
+        self.buf = buf
+        self.subsections = []  # (first_num, count, entries_offset)
+        pos += len(b"xref")
+        while True:
+            pos = _WS_RE.match(buf, pos).end()
+            if buf[pos:pos + 7] == b"trailer":
+                break
+            m = _INT_PAIR_RE.match(buf, pos)
+            if not m:
+                raise BackendError("malformed xref subsection header")
+            first, count = int(m.group(1)), int(m.group(2))
+            entries = _WS_RE.match(buf, m.end()).end()
+            self.subsections.append((first, count, entries))
+            pos = entries + count * _XREF_ENTRY_SIZE
+        self.trailer_pos = pos + 7
+
+    def lookup(self, num):
+        for first, count, entries in self.subsections:
+            if first <= num < first + count:
+                m = _XREF_ENTRY_RE.match(self.buf, entries + (num - first) * _XREF_ENTRY_SIZE)
+                if not m:
+                    raise BackendError(f"malformed xref entry for object {num}")
+                if m.group(3) == b"f":
+                    return _FREE
+                return (1, int(m.group(1)), int(m.group(2)))
+        return None
+
+class _StreamXref:
+    """One cross-reference stream section, decoded once and indexed by row."""
+
+    def __init__(self, stream):
+        self.data = stream.read_bytes()
+        self.widths = [int(w) for w in stream["/W"]]
+        self.row_len = sum(self.widths)
+        index = stream.get("/Index") or [0, stream["/Size"]]
+        self.subsections = []  # (first_num, count, first_row)
+        row = 0
+        for first, count in zip(index[::2], index[1::2]):
+            self.subsections.append((first, count, row))
+            row += count
+
+    def _field(self, start, width, default):
+        if width == 0:
+            return default
+        return int.from_bytes(self.data[start:start + width], "big")
+
+    def lookup(self, num):
+        for first, count, first_row in self.subsections:
+            if first <= num < first + count:
+                start = (first_row + num - first) * self.row_len
+                w1, w2, w3 = self.widths
+                kind = self._field(start, w1, 1)
+                field2 = self._field(start + w1, w2, 0)
+                field3 = self._field(start + w1 + w2, w3, 0)
+                if kind == 0:
+                    return _FREE
+                # (1, offset, gen) for plain objects, (2, objstm_num, index) for compressed ones
+                return (kind, field2, field3)
+        return None
+
+
+class CatalogReader(Backend):
+    """
+    Minimal pure-Python PDF reader for catalog-level triage.
+
+    Only the trailer, the cross-reference data and the objects actually
+    looked up are parsed; pages, content streams and the structure tree are
+    never touched. The file is memory-mapped, so only the handful of regions
+    read are paged in. Classic xref tables are indexed by subsection rather
+    than parsed entry by entry, and xref streams are decoded once and indexed
+    by row.
+
+    Anything this reader doesn't handle (encryption, broken xref offsets,
+    unsupported filters) raises BackendError so the caller can fall back to
+    a full backend.
+    """
+
+    catalog_only = True
+
+    def __init__(self, file_path):
+        self._file = open(file_path, "rb")
+        try:
+            self._buf = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError as e:
+            self._file.close()
+            raise BackendError(f"cannot map file: {e}") from None
+        self._objects = {}
+        self._object_streams = {}
+        self._sections = []
+        try:
+            self.trailer = self._read_xref_chain(self._find_startxref())
+            if "/Encrypt" in self.trailer:
+                raise BackendError("encrypted PDFs are not supported")
+            self._root = self.trailer["/Root"]
+            if not isinstance(self._root, PdfDict):
+                raise BackendError("catalog not found")
+            info = self.trailer.get("/Info")
+            self._docinfo = info if isinstance(info, PdfDict) else {}
+        except BackendError:
+            self.close()
+            raise
+        except (KeyError, IndexError, ValueError, TypeError, RecursionError) as e:
+            self.close()
+            raise BackendError(f"unexpected PDF structure: {e!r}") from None
+
+    @property
+    def Root(self):
+        return self._root
+
+    @property
+    def docinfo(self):
+        return self._docinfo
+
+    @property
+    def page_count(self):
+        try:
+            count = self.Root["/Pages"]["/Count"]
+        except (KeyError, TypeError) as e:
+            raise BackendError(f"page count not found: {e!r}") from None
+        if not isinstance(count, int):
+            raise BackendError(f"invalid page count {count!r}")
+        return count
+
+    def close(self):
+        if not self._buf.closed:
+            self._buf.close()
+        self._file.close()
+
+    ## Cross-reference data ================================
+
+    def _find_startxref(self):
+        buf = self._buf
+        tail_start = max(0, len(buf) - 2048)
+        pos = buf.rfind(b"startxref", tail_start)
+        if pos == -1:
+            pos = buf.rfind(b"startxref")
+        m = _STARTXREF_RE.match(buf, pos) if pos != -1 else None
+        if not m:
+            raise BackendError("startxref not found")
+        return int(m.group(1))
+
+    def _read_xref_chain(self, offset):
+        """Read xref sections newest first, following /Prev; return the newest trailer."""
+        sections = self._sections
+        trailer = None
+        seen = set()
+        while offset is not None and offset not in seen:
+            seen.add(offset)
+            pos = _WS_RE.match(self._buf, offset).end()
+            if self._buf[pos:pos + 4] == b"xref":
+                section = _ClassicXref(self._buf, pos)
+                raw, _ = self._parse(section.trailer_pos)
+                if not isinstance(raw, dict):
+                    raise BackendError("malformed trailer")
+                sections.append(section)
+                # Hybrid files list compressed objects in a separate xref stream
+                if "/XRefStm" in raw:
+                    sections.append(_StreamXref(self._read_object_at(raw["/XRefStm"])))
+                section_trailer = PdfDict(self, raw)
+            else:
+                stream = self._read_object_at(offset)
+                if not isinstance(stream, PdfStream) or stream.get("/Type") != "/XRef":
+                    raise BackendError(f"no xref at offset {offset}")
+                sections.append(_StreamXref(stream))
+                section_trailer = stream
+            if trailer is None:
+                trailer = section_trailer
+            prev = section_trailer.get("/Prev")
+            offset = int(prev) if prev is not None else None
+        # Objects looked up while reading the chain (e.g. an indirect stream
+        # /Length) may have missed sections that weren't loaded yet
+        self._objects.clear()
+        return trailer
+
+    ## Objects ================================
+
+    def resolve(self, value):
+        """Resolve a parsed value, following indirect references."""
+        if isinstance(value, Ref):
+            return self._get_object(value.num, value.gen)
+        if isinstance(value, dict):
+            return PdfDict(self, value)
+        if isinstance(value, list):
+            return [self.resolve(item) for item in value]
+        if isinstance(value, bytes):
+            return _decode_text(value)
+        return value
+
+    def _lookup(self, num):
+        """The newest xref entry for object num, or None if missing or deleted."""
+        for section in self._sections:
+            entry = section.lookup(num)
+            if entry is not None:
+                return None if entry is _FREE else entry
+        return None
+
+    def _exists(self, num):
+        return self._lookup(num) is not None
+
+    def _get_object(self, num, gen=0):
+        """
+        Read object num, searching xref sections newest first.
+
+        References to missing or deleted objects resolve to None, as the PDF
+        spec (and pikepdf) treat them as null.
+        """
+        key = (num, gen)
+        if key in self._objects:
+            if self._objects[key] is _READING:
+                raise BackendError(f"reference cycle through object {num}")
+            return self._objects[key]
+        entry = self._lookup(num)
+        if entry is None:
+            return None
+
+        self._objects[key] = _READING
+        try:
+            if entry[0] == 1:
+                obj = self._read_object_at(entry[1], num, gen)
+            elif entry[0] == 2:
+                if gen != 0:
+                    raise BackendError(f"object {num} {gen} R points at a compressed object")
+                obj = self._read_compressed_object(entry[1], entry[2], num)
+            else:
+                raise BackendError(f"unknown xref entry type {entry[0]} for object {num}")
+        except (KeyError, IndexError, ValueError, TypeError, RecursionError) as e:
+            raise BackendError(f"could not read object {num}: {e!r}") from None
+        finally:
+            if self._objects[key] is _READING:
+                del self._objects[key]
+        self._objects[key] = obj
+        return obj
+
+    def _read_object_at(self, offset, num=None, gen=None):
+        """Read the object at offset; with num and gen, check its header matches them."""
+        m = _OBJ_HEADER_RE.match(self._buf, offset)
+        if not m:
+            raise BackendError(f"no object at offset {offset}")
+        if num is not None and (int(m.group(1)), int(m.group(2))) != (num, gen):
+            # A stale xref offset; the header names a different object
+            raise BackendError(
+                f"xref offset {offset} for object {num} {gen} points at object {m.group(1).decode()} {m.group(2).decode()}"
+            )
+        raw, pos = self._parse(m.end())
+        if isinstance(raw, dict):
+            pos = _WS_RE.match(self._buf, pos).end()
+            if self._buf[pos:pos + 6] == b"stream":
+                return PdfStream(self, raw, self._stream_data(raw, pos + 6))
+        return self.resolve(raw)
+
+    def _stream_data(self, raw, pos):
+        buf = self._buf
+        if buf[pos:pos + 2] == b"\r\n":
+            pos += 2
+        elif buf[pos:pos + 1] in (b"\n", b"\r"):
+            pos += 1
+        try:
+            length = self.resolve(raw.get("/Length"))
+        except BackendError:
+            # e.g. an indirect /Length in a section that isn't loaded yet
+            length = None
+        if isinstance(length, int):
+            end = _WS_RE.match(buf, pos + length).end()
+            if buf[end:end + 9] == b"endstream":
+                return buf[pos:pos + length]
+        # /Length missing or wrong; fall back to scanning for endstream
+        end = buf.find(b"endstream", pos)
+        if end == -1:
+            raise BackendError("unterminated stream")
+        return buf[pos:end].rstrip(b"\r\n")
+
+    def _read_compressed_object(self, stream_num, index, num):
+        if stream_num not in self._object_streams:
+            stream = self._get_object(stream_num)
+            if not isinstance(stream, PdfStream):
+                raise BackendError(f"object stream {stream_num} not found")
+            data = stream.read_bytes()
+            header = data[:stream["/First"]].split()
+            nums = [int(n) for n in header[0::2]]
+            offsets = [int(n) for n in header[1::2]]
+            self._object_streams[stream_num] = (data, stream["/First"], nums, offsets)
+        data, first, nums, offsets = self._object_streams[stream_num]
+        if nums[index] != num:
+            raise BackendError(f"object stream {stream_num} holds object {nums[index]} at index {index}, not {num}")
+        raw, _ = _Parser(data).parse(first + offsets[index])
+        return self.resolve(raw)
+
+    def _parse(self, pos):
+        return _Parser(self._buf).parse(pos)
+
+
+class _Parser:
+    """Recursive-descent parser for a single PDF object in a byte buffer."""
+
+    def __init__(self, buf):
+        self.buf = buf
+
+    def parse(self, pos):
+        """Parse one object at pos; return (raw_value, end_pos)."""
+        buf = self.buf
+        pos = _WS_RE.match(buf, pos).end()
+        c = buf[pos:pos + 1]
+        if c == b"/":
+            m = _TOKEN_RE.match(buf, pos + 1)
+            end = m.end() if m else pos + 1
+            return self._name(buf[pos + 1:end]), end
+        if c == b"<":
+            if buf[pos + 1:pos + 2] == b"<":
+                return self._dict(pos + 2)
+            end = buf.find(b">", pos)
+            if end == -1:
+                raise BackendError("unterminated hex string")
+            digits = _HEX_DIGITS_RE.sub(b"", buf[pos + 1:end])
+            if len(digits) % 2:
+                digits += b"0"
+            return bytes.fromhex(digits.decode()), end + 1
+        if c == b"[":
+            return self._array(pos + 1)
+        if c == b"(":
+            return self._literal_string(pos + 1)
+        m = _REF_RE.match(buf, pos)
+        if m:
+            return Ref(int(m.group(1)), int(m.group(2))), m.end()
+        m = _TOKEN_RE.match(buf, pos)
+        if not m:
+            raise BackendError(f"unexpected {c!r} at offset {pos}")
+        token = m.group()
+        if token == b"true":
+            return True, m.end()
+        if token == b"false":
+            return False, m.end()
+        if token == b"null":
+            return None, m.end()
+        try:
+            return (float(token) if b"." in token else int(token)), m.end()
+        except ValueError:
+            raise BackendError(f"unexpected token {token!r} at offset {pos}") from None
+
+    @staticmethod
+    def _name(raw):
+        name = re.sub(rb"#([0-9A-Fa-f]{2})", lambda m: bytes.fromhex(m.group(1).decode()), raw)
+        return "/" + name.decode("latin-1")
+
+    def _dict(self, pos):
+        buf = self.buf
+        result = {}
+        while True:
+            pos = _WS_RE.match(buf, pos).end()
+            if buf[pos:pos + 2] == b">>":
+                return result, pos + 2
+            key, pos = self.parse(pos)
+            if not isinstance(key, str):
+                raise BackendError(f"dictionary key is not a name at offset {pos}")
+            value, pos = self.parse(pos)
+            result[key] = value
+
+    def _array(self, pos):
+        buf = self.buf
+        result = []
+        while True:
+            pos = _WS_RE.match(buf, pos).end()
+            if buf[pos:pos + 1] == b"]":
+                return result, pos + 1
+            m = _REF_RUN_RE.match(buf, pos)
+            if m:
+                result.extend(Ref(int(num), int(gen)) for num, gen in _REF_PAIR_RE.findall(m.group()))
+                pos = m.end()
+                continue
+            value, pos = self.parse(pos)
+            result.append(value)
+
+    def _literal_string(self, pos):
+        buf = self.buf
+        out = bytearray()
+        depth = 1
+        while True:
+            c = buf[pos:pos + 1]
+            if not c:
+                raise BackendError("unterminated string")
+            pos += 1
+            if c == b"\\":
+                if pos >= len(buf):
+                    raise BackendError("unterminated string")
+                esc = buf[pos]
+                pos += 1
+                if esc in _STRING_ESCAPES:
+                    out += _STRING_ESCAPES[esc]
+                elif 0x30 <= esc <= 0x37:
+                    digits = bytes([esc])
+                    while len(digits) < 3 and pos < len(buf) and 0x30 <= buf[pos] <= 0x37:
+                        digits += bytes([buf[pos]])
+                        pos += 1
+                    out.append(int(digits, 8) & 0xFF)
+                elif esc == 0x0D:
+                    # Line continuation; swallow a following \n too
+                    if buf[pos:pos + 1] == b"\n":
+                        pos += 1
+                elif esc != 0x0A:
+                    out.append(esc)
+                continue
+            if c == b"(":
+                depth += 1
+            elif c == b")":
+                depth -= 1
+                if depth == 0:
+                    return bytes(out), pos
+            out += c
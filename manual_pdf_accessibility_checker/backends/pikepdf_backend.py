@@ -0,0 +1,34 @@
+import pikepdf
+
+from .base import Backend
+
+
+class PikepdfBackend(Backend):
+    """
+    Full backend built on pikepdf.
+
+    Anything not defined here (`pages`, `trailer`, ...) is delegated
+    to the underlying pikepdf.Pdf, so page-level checks that work with pikepdf
+    objects directly keep working unchanged.
+    """
+
+    def __init__(self, file_path):
+        self.pdf = pikepdf.Pdf.open(file_path)
+
+    def __getattr__(self, name):
+        return getattr(self.pdf, name)
+
+    @property
+    def Root(self):
+        return self.pdf.Root
+
+    @property
+    def docinfo(self):
+        return self.pdf.docinfo
+
+    @property
+    def page_count(self):
+        return len(self.pdf.pages)
+
+    def close(self):
+        self.pdf.close()
@@ -0,0 +1,251 @@
+from .backends import BackendError, open_backend
+from .checks.document import (
+    XmpMetadata,
+    check_document_language,
+    check_document_title,
+    check_for_bookmarks,
+    check_for_image_only_pages,
+    check_markinfo,
+)
+
+# Every item the checklist can contain, in report order. Some items (e.g.
+# "Bookmarks Count") only appear in a given checklist when they fire.
+CHECKLIST_ITEMS = {
+    "document-level": [
+        "Image-only Pages", "Tagged", "Language", "Title", "Bookmarks", "Bookmarks Count",
+    ],
+    "page-level": [
+        "Page Content Tagged", "Annotations Tagged", "Tab Order", "Character Encoding",
+        "Multimedia Tagged", "Flickering", "Inaccessible Scripts", "Timed Responses",
+        "Navigation Links",
+    ],
+    "forms": ["Form Fields Tagged", "Form Field Descriptions"],
+    "alternate text": [
+        "Alternate Text", "Nested Alternate Text", "Alternate Text Association",
+        "Alt Text Hides Annotations", "Other Alt Text Elements",
+    ],
+    "tables": [
+        "Table Row Structure", "Table Cell Structure", "Table Headers",
+        "Table Regularity", "Table Summary",
+    ],
+    "lists": ["List Item Structure", "List Label/Body Structure"],
+    "headings": ["Heading Nesting"],
+}
+
+
+def open_pdf(file_path, backend="pikepdf"):
+    """Open a PDF with the named backend, falling back to pikepdf if the fast reader can't."""
+    try:
+        return open_backend(backend, file_path)
+    except BackendError as e:
+        if backend == "pikepdf":
+            raise
+        print(f"{backend} backend could not read {file_path} ({e}); falling back to pikepdf.")
+        return open_backend("pikepdf", file_path)
+
+def check_document_level(pdf, args, catalog_only=False):
+    """Run the document-level checks; with catalog_only, only the catalog checks."""
+    results = {}
+
+    # Check for image only pages, and get page count
+    if catalog_only:
+        results["Image-only Pages"] = "N/A (catalog-only backend)"
+        num_pages = pdf.page_count
+    else:
+        results["Image-only Pages"], num_pages = check_for_image_only_pages(pdf)
+
+    # Check MarkInfo (indicates tagged PDF)
+    results["Tagged"] = check_markinfo(pdf)
+
+    # XMP metadata is only parsed if a check needs to fall back to it
+    xmp = XmpMetadata(pdf)
+
+    # Check for Document language
+    results["Language"] = check_document_language(pdf, xmp)
+
+    # Check for Document Title
+    results["Title"] = check_document_title(pdf, xmp)
+
+    # Check for bookmarks/outlines in documents over 20 pages
+    if args.force_warning:
+        num_pages = 800 # just for debugging/testing
+    print(f"Number of pages: {num_pages}")
+    page_threshold = 20
+    if num_pages > page_threshold or args.force_bookmark_check:
+        results["Bookmarks"], bookmark_count = check_for_bookmarks(pdf)
+        print(f"Number of bookmarks: {bookmark_count}")
+        if results["Bookmarks"] == "pass":
+            if  num_pages / bookmark_count > 30:
+                results["Bookmarks Count"] = f"Warning (only {bookmark_count} bookmarks for {num_pages} pages)"
+    else:
+        results["Bookmarks"] = "N/A (under 20 pages)"
+
+    return results
+
+def check_pdf_accessibility(file_path, args):
+    """Check if a PDF is tagged for accessibility."""
+    checklist = {category: {} for category in CHECKLIST_ITEMS}
+
+    backend = getattr(args, "backend", "pikepdf")
+    # Catalog triage keeps its checklist shape even if the catalog reader
+    # has to fall back to pikepdf for this file
+    catalog_only = backend == "catalog"
+    pdf = open_pdf(file_path, backend)
+
+    ## Document-level checks ================================
+
+    try:
+        # Root catalog - the jumping off point
+        print(f"{pdf.Root.keys() = }")
+
+        # Check for structure tree root
+        if "/StructTreeRoot" in pdf.Root:
+            struct_tree = pdf.Root.StructTreeRoot
+            print("Structure Tree Root found:")
+            print(struct_tree.keys())
+            # /K contains the structure elements
+
+        checklist["document-level"] = check_document_level(pdf, args, catalog_only)
+    except BackendError as e:
+        if not pdf.catalog_only:
+            raise
+        print(f"Catalog reader failed on {file_path} ({e}); falling back to pikepdf.")
+        pdf.close()
+        pdf = open_pdf(file_path)
+        checklist["document-level"] = check_document_level(pdf, args, catalog_only)
+
+    ## Page-level checks ================================
+
+    # These walk pages and pikepdf objects, so they need a full backend
+    untagged_annotations = {}
+    if catalog_only:
+        for item in ("Page Content Tagged", "Annotations Tagged", "Tab Order", "Character Encoding"):
+            checklist["page-level"][item] = "N/A (catalog-only backend)"
+    else:
+        from .checks.page import (
+            check_annotations_tagged,
+            check_character_encoding,
+            check_navigation_links,
+            check_page_tagging,
+            check_tab_order,
+        )
+
+        # Check that all page content is tagged
+        checklist["page-level"]["Page Content Tagged"] = check_page_tagging(pdf)
+
+        # Check that all annotations are tagged
+        checklist["page-level"]["Annotations Tagged"], untagged_annotations = check_annotations_tagged(pdf)
+
+        # Check that tab order is consistent with structure order
+        checklist["page-level"]["Tab Order"] = check_tab_order(pdf)
+
+        # Check that character encoding is reliably specified
+        checklist["page-level"]["Character Encoding"] = check_character_encoding(pdf)
+
+    # Check that all multimedia content is tagged
+    checklist["page-level"]["Multimedia Tagged"] = "Not implemented"
+
+    # Check that page will not cause flickering
+    checklist["page-level"]["Flickering"] = "Not implemented"
+
+    # Check that there are no inaccessible scripts
+    checklist["page-level"]["Inaccessible Scripts"] = "Not implemented"
+
+    # Check that no pages require timed responses
+    checklist["page-level"]["Timed Responses"] = "Not implemented"
+
+    # Check that navigation links are not repetitive
+    if catalog_only:
+        checklist["page-level"]["Navigation Links"] = "N/A (catalog-only backend)"
+    else:
+        checklist["page-level"]["Navigation Links"] = check_navigation_links(pdf)
+
+    ## Form checks ================================
+
+    # Check that form fields are tagged
+    checklist["forms"]["Form Fields Tagged"] = "Not implemented"
+
+    # Check that form fields have descriptions
+    checklist["forms"]["Form Field Descriptions"] = "Not implemented"
+    ## Alternate Text Checks ================================
+
+    # Check that all figures have alternate text
+    checklist["alternate text"]["Alternate Text"] = "Not implemented"
+
+    # Check against nested alt text that will never be read
+    checklist["alternate text"]["Nested Alternate Text"] = "Not implemented"
+    # Check that alt text is associated with content
+    checklist["alternate text"]["Alternate Text Association"] = "Not implemented"
+
+    # Check that alt text does not hide annotations
+    checklist["alternate text"]["Alt Text Hides Annotations"] = "Not implemented"
+
+    # Check for other elements that require alt text
+    checklist["alternate text"]["Other Alt Text Elements"] = "Not implemented"
+
+    ## Table Checks ================================
+
+    # Check that table rows (TR) are children of Table, THead, TBody, or TFoot
+    checklist["tables"]["Table Row Structure"] = "Not implemented"
+
+    # Check that TH and TD are children of TR
+    checklist["tables"]["Table Cell Structure"] = "Not implemented"
+
+    # Check that tables have headers
+    checklist["tables"]["Table Headers"] = "Not implemented"
+
+    # Check that tables have regular structure (same number of columns in each row)
+    checklist["tables"]["Table Regularity"] = "Not implemented"
+
+    # Check that tables have summaries
+    checklist["tables"]["Table Summary"] = "Not implemented"
+
+    ## List Checks ================================
+
+    # Check that list items (LI) are children of List (L) or ListItem (LI)
+    checklist["lists"]["List Item Structure"] = "Not implemented"
+
+    # Check that labels (Lbl) and bodies (LBody) are children of LI
+    checklist["lists"]["List Label/Body Structure"] = "Not implemented"
+
+    ## Heading Checks ================================
+
+    # Check for appropriate nesting
+    checklist["headings"]["Heading Nesting"] = "Not implemented"
+
+    ## Misc and Reporting ================================
+
+    # Poke at a specific page's resources
+    if not catalog_only:
+        page = pdf.pages[0]
+        print("First Page Keys:")
+        print(page.keys())
+        if "/Resources" in page:
+            print("First Page Resources:")
+            print(page.Resources.keys())
+
+    pdf.close()
+
+    print_checklist(checklist)
+
+    # Extra detail that doesn't fit in a checklist string, for reports
+    details = {"untagged_annotations": untagged_annotations}
+    return checklist, details
+
+
+def print_checklist(checklist):
+    """Print the checklist results, color coded by status."""
+    print("\n","- " * 25)
+    print("Accessibility Checklist Results:")
+    for category, items in checklist.items():
+        print(f"{category.capitalize()}:")
+        for item, result in items.items():
+            if result.startswith("pass"):
+                result = f"\033[92m{result}\033[0m"  # green
+            elif result.startswith("fail"):
+                result = f"\033[91m{result}\033[0m"  # red
+            elif result.startswith("Warning"):
+                result = f"\033[38;5;208m{result}\033[0m"  # light orange
+            elif result.startswith("Not implemented"):
+                result = f"\033[95m{result}\033[0m"  # light purple
+            print(f"  {item}: {result}")
@@ -0,0 +1 @@
+"""Accessibility checks, grouped by the checklist category they report under."""
@@ -0,0 +1,170 @@
+from functools import cached_property
+
+
+def check_for_image_only_content(page):
+    """Check if a page contains only images."""
+    resources = page.get("/Resources", {})
+    fonts = resources.get("/Font", {})
+    if not fonts:
+        print("No fonts found on this page; it may be image-only.")
+        return True
+    return False
+
+def check_for_image_only_pages(pdf):
+    """Check all pages for image-only content."""
+    if "/Pages" not in pdf.Root:
+        print("No /Pages found in PDF.")
+        raise ValueError("Invalid PDF structure: No /Pages found.")
+    image_only_pages = []
+    pages = pdf.pages
+    for i, page in enumerate(pages):
+        if check_for_image_only_content(page):
+            image_only_pages.append(i + 1)  # Page numbers are 1-based
+    if image_only_pages:
+        print(f"Image-only pages found: {image_only_pages}")
+        return ("fail", i + 1)
+    print("No image-only pages found.")
+    # We can also return the page count for other uses
+    return ("pass", i + 1)
+
+def check_markinfo(pdf):
+    """Check for MarkInfo dictionary."""
+    if "/MarkInfo" in pdf.Root:
+        print("MarkInfo found:")
+        print(pdf.Root.MarkInfo)  # look for /Marked = true
+        return "pass"
+    print("No MarkInfo found.")
+    return "fail"
+
+class XmpMetadata:
+    """
+    Lazily decoded XMP metadata (the /Metadata stream off the catalog).
+
+    PDFs can store metadata in the Info dictionary (older style) and/or in
+    XMP, and some tools only populate one. The stream is only decoded and
+    parsed the first time a value is needed, then cached for the document,
+    so checks that find what they need in the catalog or docinfo never pay
+    for XML parsing.
+    """
+
+    NAMESPACES = {
+        "rdf": "http://www.w3.org/1999/02/22-rdf-syntax-ns#",
+        "dc": "http://purl.org/dc/elements/1.1/",
+        "pdfuaid": "http://www.aiim.org/pdfua/ns/id/",
+    }
+
+    def __init__(self, pdf):
+        self.pdf = pdf
+
+    @cached_property
+    def _root(self):
+        """Parsed XMP tree, or None if missing or unreadable."""
+        import xml.etree.ElementTree as ET
+
+        metadata = self.pdf.Root.get("/Metadata")
+        if not hasattr(metadata, "read_bytes"):
+            return None
+        try:
+            data = metadata.read_bytes()
+        except Exception as e:
+            print(f"Could not read XMP metadata stream: {e}")
+            return None
+        try:
+            return ET.fromstring(data)
+        except Exception as e:
+            print(f"Could not parse XMP metadata: {e}")
+            return None
+
+    def _values(self, tag):
+        """Get the rdf:li values (or plain text) of a dc property."""
+        if self._root is None:
+            return []
+        values = []
+        for element in self._root.iterfind(f".//{tag}", self.NAMESPACES):
+            items = element.findall(".//rdf:li", self.NAMESPACES)
+            texts = [item.text for item in items] if items else [element.text]
+            values.extend(t.strip() for t in texts if t and t.strip())
+        return values
+
+    @cached_property
+    def title(self):
+        values = self._values("dc:title")
+        return values[0] if values else None
+
+    @cached_property
+    def languages(self):
+        return self._values("dc:language")
+
+    @cached_property
+    def pdfua_part(self):
+        """PDF/UA part number claimed by pdfuaid:part, as an element or attribute."""
+        if self._root is None:
+            return None
+        values = self._values("pdfuaid:part")
+        if values:
+            return values[0]
+        attr = "{%s}part" % self.NAMESPACES["pdfuaid"]
+        for description in self._root.iterfind(".//rdf:Description", self.NAMESPACES):
+            if attr in description.attrib:
+                return description.attrib[attr]
+        return None
+
+    def with_pdfua_claim(self, result):
+        """Note any PDF/UA claim on a result that fell back to XMP, e.g. 'fail (claims PDF/UA-1)'."""
+        if not self.pdfua_part:
+            return result
+        claim = f"claims PDF/UA-{self.pdfua_part}"
+        if result.endswith(")"):
+            return f"{result[:-1]}; {claim})"
+        return f"{result} ({claim})"
+
+def check_document_language(pdf, xmp=None):
+    """Check for document language specification, falling back to XMP dc:language."""
+    if "/Lang" in pdf.Root:
+        print("Document Language:")
+        print(pdf.Root.Lang)
+        return "pass"
+    xmp = xmp or XmpMetadata(pdf)
+    if xmp.languages:
+        print(f"Document Language (XMP dc:language only): {xmp.languages}")
+        return xmp.with_pdfua_claim("Warning (language only in XMP metadata, /Lang not set)")
+    print("No document language specified.")
+    return xmp.with_pdfua_claim("fail")
+
+def check_document_title(pdf, xmp=None):
+    """Check for document title in metadata, falling back to XMP dc:title."""
+    if pdf.docinfo and "/Title" in pdf.docinfo:
+        print("Document Title:")
+        print(pdf.docinfo["/Title"])
+        return "pass"
+    xmp = xmp or XmpMetadata(pdf)
+    if xmp.title:
+        print("Document Title (XMP dc:title):")
+        print(xmp.title)
+        return xmp.with_pdfua_claim("pass")
+    print("No document title found.")
+    return xmp.with_pdfua_claim("fail")
+
+def count_bookmarks(bookmark):
+    """Recursively count bookmarks."""
+    count = 1  # Count this bookmark
+    if "/First" in bookmark:
+        first = bookmark["/First"]
+        count += count_bookmarks(first)
+    if "/Next" in bookmark:
+        next_bm = bookmark["/Next"]
+        count += count_bookmarks(next_bm)
+    return count
+
+def check_for_bookmarks(pdf):
+    """Check for bookmarks/outlines in the PDF."""
+    if "/Outlines" not in pdf.Root:
+        print("No outlines/bookmarks found.")
+        return ("fail", 0)
+    outlines = pdf.Root.Outlines
+    if "/First" not in outlines:
+        print("Empty bookmark structure.")
+        return ("fail", 0)
+    print("Bookmarks found.")
+    bookmark_count = count_bookmarks(outlines.First)
+    return ("pass", bookmark_count)
@@ -0,0 +1,492 @@
+import pikepdf
+
+
+def get_kids(page):
+    """Recursively get all kids of a page."""
+    kids = []
+    if "/Kids" in page:
+        for kid in page["/Kids"]:
+            kids.append(kid)
+            kid_obj = kid.get_object()
+            kids.extend(get_kids(kid_obj))
+    return kids
+
+def check_page_tagging(pdf):
+    """Check if all page content is tagged."""
+    if "/StructTreeRoot" not in pdf.Root:
+        print("No structure tree found; PDF is untagged.")
+        return "fail"
+    struct_root = pdf.Root.StructTreeRoot
+    print("Structure Tree Root found.")
+    
+    print(f'{struct_root.keys() = }')
+    if "/K" in struct_root:
+        kids = struct_root.K
+        if isinstance(kids, pikepdf.Array):
+            print(f"Structure tree has {len(kids)} top-level kids.")
+            for i, kid in enumerate(kids):
+                print(kid.keys() if hasattr(kid, 'keys') else kid)
+        else:
+            print("Structure tree has a single top-level kid.")
+            print(kids.keys() if hasattr(kids, 'keys') else kids)
+            top_element = kids
+            print(f'{type(top_element) = }')
+            if "/K" in top_element:
+                te_kids = top_element.K
+                if isinstance(te_kids, pikepdf.Array):
+                    print(f"Top element has {len(te_kids)} kids.")
+                    # Look at first few kids
+                    for j, te_kid in enumerate(list(te_kids)[:5]):
+                        print(te_kid.keys() if hasattr(te_kid, 'keys') else te_kid)
+                else:
+                    print("Top element has a single kid.")
+                    print(te_kids.keys() if hasattr(te_kids, 'keys') else te_kids)
+
+    else:
+        print("No /K found in StructTreeRoot; PDF is untagged.")
+        return "fail"
+
+    # max_depth = 4
+    # print(f"Peeking at structure tree (max depth = {max_depth}):")
+    # peek_structure_with_pages(struct_root, pdf, max_depth=max_depth)
+
+    tagged = collect_tagged_pages(struct_root, pdf)
+    all_pages = set(range(1, len(pdf.pages) + 1))
+    untagged_pages = all_pages - tagged
+    if untagged_pages:
+        print(f"Untagged pages found: {sorted(untagged_pages)}")
+        return "fail"
+    print("All pages have tagged content.")
+    return "pass - ROUGH CHECK ONLY"
+
+def get_page_number(page_ref, pdf):
+    """Convert a page object reference to a page number."""
+    for i, page in enumerate(pdf.pages):
+        if page.objgen == page_ref.objgen:
+            return i + 1  # 1-indexed
+    return None
+
+# def peek_structure(element, depth=0, max_depth=3):
+#     """Recursively peek at structure elements."""
+#     if depth > max_depth:
+#         return
+    
+#     indent = "  " * depth
+    
+#     if not hasattr(element, 'keys'):
+#         # It's a content reference (MCR or OBJR), not a structure element
+#         print(f"{indent}[content ref: {element}]")
+#         return
+    
+#     tag = element.get('/S', '???')
+#     page = element.get('/Pg', None)
+#     page_info = f" (page ref exists)" if page else ""
+#     print(f"{indent}{tag}{page_info}")
+    
+#     if "/K" in element:
+#         kids = element.K
+#         if isinstance(kids, pikepdf.Array):
+#             for kid in kids:
+#                 peek_structure(kid, depth + 1, max_depth)
+#         else:
+#             peek_structure(kids, depth + 1, max_depth)
+
+# def peek_structure_with_pages(element, pdf, depth=0, max_depth=3):
+#     if depth > max_depth:
+#         return
+    
+#     indent = "  " * depth
+    
+#     if not hasattr(element, 'keys'):
+#         print(f"{indent}[MCID: {element}]")
+#         return
+    
+#     tag = element.get('/S', '???')
+#     page_num = ""
+#     if "/Pg" in element:
+#         pn = get_page_number(element.Pg, pdf)
+#         page_num = f" [p.{pn}]"
+    
+#     print(f"{indent}{tag}{page_num}")
+    
+#     if "/K" in element:
+#         kids = element.K
+#         if isinstance(kids, pikepdf.Array):
+#             for kid in kids:
+#                 peek_structure_with_pages(kid, pdf, depth + 1, max_depth)
+#         else:
+#             peek_structure_with_pages(kids, pdf, depth + 1, max_depth)
+
+def collect_tagged_pages(element, pdf, tagged_pages=None):
+    """Walk structure tree, collect set of page numbers that have tags."""
+    if tagged_pages is None:
+        tagged_pages = set()
+    
+    if not hasattr(element, 'keys'):
+        # MCID reference, not a structure element
+        return tagged_pages
+    
+    if "/Pg" in element:
+        pn = get_page_number(element.Pg, pdf)
+        if pn:
+            tagged_pages.add(pn)
+    
+    if "/K" in element:
+        kids = element.K
+        if isinstance(kids, pikepdf.Array):
+            for kid in kids:
+                collect_tagged_pages(kid, pdf, tagged_pages)
+        else:
+            collect_tagged_pages(kids, pdf, tagged_pages)
+    
+    return tagged_pages
+
+def check_annotations_tagged(pdf):
+    """
+    Check if all annotations are tagged.
+    
+    Returns the result along with a dict mapping each untagged annotation
+    subtype to the pages it appears on (one entry per annotation).
+    """
+    # Collect all OBJR references in the structure tree. Without a tree,
+    # every annotation is untagged, but we still list them for reports.
+    objr_refs = set()
+    has_struct_tree = "/StructTreeRoot" in pdf.Root
+    if has_struct_tree:
+        _collect_objr_references(pdf.Root.StructTreeRoot, objr_refs, pdf)
+    else:
+        print("No structure tree found; PDF is untagged.")
+
+    # Check each page's annotations
+    untagged_annots = []
+    for page_num, page in enumerate(pdf.pages, start=1):
+        if "/Annots" not in page:
+            continue
+        for annot_ref in page.Annots:
+            annot_obj = (
+                annot_ref.get_object() 
+                if hasattr(annot_ref, 'get_object') 
+                else annot_ref
+                )
+            # Check if this annotation is referenced in the structure tree
+            if _get_obj_id(annot_obj, pdf) not in objr_refs:
+                subtype = str(annot_obj.get("/Subtype", "Unknown"))
+                untagged_annots.append((page_num, subtype))
+
+    if not untagged_annots:
+        if not has_struct_tree:
+            return ("fail", {})
+        print("All annotations are tagged.")
+        return ("pass", {})
+    by_type = {}
+    for page_num, subtype in untagged_annots:
+        by_type.setdefault(subtype, []).append(page_num)
+
+    details = "; ".join(
+        [f"{subtype} on pages {sorted(pages)}" for subtype, pages in by_type.items()]
+    )
+    print(f"Untagged annotations found: {details}")
+    return ("fail", by_type)
+
+def _get_obj_id(obj, pdf):
+    """Get the object ID for a given PDF object."""
+    if hasattr(obj, 'objgen'):
+        return obj.objgen
+    return id(obj) # Fallback to Python id
+
+def _collect_objr_references(node, refs: set, pdf):
+    """Recursively collect OBJR references from structure tree."""
+
+    # Resolve if it's a reference
+    if isinstance(node, pikepdf.Object):
+        try:
+            node = node.get_object() if hasattr(node, 'get_object') else node
+        except Exception:
+            return
+    
+    # Skip non-dictionary types (integers, strings, etc.)
+    if not isinstance(node, pikepdf.Dictionary):
+        return
+    
+    k = node.get("/K")
+    if k is None:
+        return
+    
+    # /K can be a single item or array
+    if isinstance(k, pikepdf.Array):
+        items = list(k)
+    else:
+        items = [k]
+    
+    for item in items:
+        # Skip integers (MCIDs) and other primitives
+        if isinstance(item, (int, str)) or not isinstance(item, pikepdf.Object):
+            continue
+        
+        try:
+            item_obj = item.get_object() if hasattr(item, 'get_object') else item
+        except Exception:
+            continue
+        
+        # Skip if not a dictionary
+        if not isinstance(item_obj, pikepdf.Dictionary):
+            continue
+        
+        item_type = item_obj.get("/Type")
+        if item_type == pikepdf.Name("/OBJR"):
+            # Object reference to an annotation
+            ref_obj = item_obj.get("/Obj")
+            if ref_obj is not None:
+                refs.add(_get_obj_id(ref_obj, pdf))
+        else:
+            # Structure element—recurse into it
+            _collect_objr_references(item_obj, refs, pdf)
+
+def _iter_page_annotations(pdf):
+    """Yield (page_num, page, annotations) for each page that has annotations.
+
+    Annotation references are resolved, and anything that is not a
+    dictionary is skipped.
+    """
+    for page_num, page in enumerate(pdf.pages, start=1):
+        annots = page.get("/Annots")
+        if not annots:
+            continue
+        
+        annot_objs = []
+        for annot in annots:
+            try:
+                annot_obj = annot.get_object() if hasattr(annot, 'get_object') else annot
+            except Exception:
+                continue
+            if isinstance(annot_obj, pikepdf.Dictionary):
+                annot_objs.append(annot_obj)
+        
+        if annot_objs:
+            yield page_num, page, annot_objs
+
+def check_tab_order(pdf):
+    """
+    Check that tab order follows structure order on pages with focusable elements.
+    
+    WCAG 2.4.3 Focus Order: focusable components should receive focus in an
+    order that preserves meaning and operability. For PDFs, this means pages
+    with links or form fields should have /Tabs /S (structure order).
+    """
+    if "/StructTreeRoot" not in pdf.Root:
+        return "fail"
+    
+    # Annotation subtypes that are keyboard-focusable
+    FOCUSABLE_SUBTYPES = {
+        pikepdf.Name("/Link"),
+        pikepdf.Name("/Widget"),  # form fields
+    }
+    
+    problem_pages = []
+    pages_with_focusable = 0
+    
+    for page_num, page, annots in _iter_page_annotations(pdf):
+        # Check if page has focusable annotations
+        has_focusable = any(
+            annot.get("/Subtype") in FOCUSABLE_SUBTYPES for annot in annots
+        )
+        
+        if not has_focusable:
+            continue
+        
+        pages_with_focusable += 1
+        
+        # Page has focusable elements—check tab order
+        tabs = page.get("/Tabs")
+        if tabs != pikepdf.Name("/S"):
+            tab_value = str(tabs) if tabs else "unset"
+            problem_pages.append((page_num, tab_value))
+    
+    if pages_with_focusable == 0:
+        return "N/A (no focusable elements)"
+    
+    if not problem_pages:
+        return "pass"
+    
+    # Group by tab order type
+    by_type = {}
+    for pg, t in problem_pages:
+        by_type.setdefault(t, []).append(pg)
+    
+    details = "; ".join(f"{t}: pages {_summarize_pages(pgs)}" for t, pgs in by_type.items())
+    print(f"Tab order not set to structure order: {details}")
+    return "fail"
+
+
+def _summarize_pages(pages: list) -> str:
+    """Summarize page list, e.g., [1,2,3,5,6,8] -> '1-3, 5-6, 8'"""
+    if not pages:
+        return ""
+    
+    pages = sorted(set(pages))
+    ranges = []
+    start = end = pages[0]
+    
+    for p in pages[1:]:
+        if p == end + 1:
+            end = p
+        else:
+            ranges.append(f"{start}-{end}" if start != end else str(start))
+            start = end = p
+    
+    ranges.append(f"{start}-{end}" if start != end else str(start))
+    return ", ".join(ranges)
+
+
+def _link_signature(annot):
+    """Build a hashable key for a link from its /Rect and its /A or /Dest target.
+
+    Raises TypeError or ValueError if /Rect isn't an array of numbers.
+    """
+    rect = tuple(round(float(v), 1) for v in annot.get("/Rect", []))
+    target = annot.get("/A")
+    if target is None:
+        target = annot.get("/Dest")
+    if target is None:
+        target_key = b""
+    elif isinstance(target, pikepdf.Object):
+        target_key = target.unparse(resolved=True)
+    else:
+        # Malformed targets (e.g. /Dest 3) come back as plain Python values
+        target_key = repr(target).encode()
+    return rect, target_key
+
+def check_navigation_links(pdf):
+    """
+    Check for navigation link blocks repeated across pages.
+    
+    WCAG 2.4.1 Bypass Blocks: blocks of content repeated on multiple pages
+    (e.g., a navigation bar in a header or footer) should be skippable.
+    Each page's links are reduced to a signature of their /Rect and target,
+    and pages with identical signatures are grouped in a single pass.
+    Links with a malformed /Rect are left out of their page's signature.
+
+    Pages are only grouped when their whole set of links matches, so this
+    misses a repeated nav bar on pages that also carry one extra link (the
+    signatures differ), and it flags pages whose only link is the same
+    shared one, such as a lone "back to top" link in the footer.
+    """
+    pages_by_signature = {}
+    
+    for page_num, page, annots in _iter_page_annotations(pdf):
+        links = []
+        for annot in annots:
+            if annot.get("/Subtype") != pikepdf.Name("/Link"):
+                continue
+            try:
+                links.append(_link_signature(annot))
+            except (TypeError, ValueError):
+                continue
+        if not links:
+            continue
+        # The dict hashes the signature, so grouping is a single linear pass
+        signature = tuple(sorted(links))
+        pages_by_signature.setdefault(signature, []).append(page_num)
+    
+    if not pages_by_signature:
+        return "N/A (no links)"
+    
+    repeated = [pgs for pgs in pages_by_signature.values() if len(pgs) > 1]
+    if not repeated:
+        return "pass"
+    
+    details = "; ".join(f"pages {_summarize_pages(pgs)}" for pgs in repeated)
+    print(f"Repeated navigation links found: {details}")
+    return f"Warning (repeated navigation links on {sum(len(pgs) for pgs in repeated)} pages)"
+
+def check_character_encoding(pdf):
+    """
+    Check that fonts have reliable character encoding for text extraction.
+    
+    WCAG 4.1.1 Parsing / PDF/UA: Text must be extractable with correct
+    Unicode values. Fonts should have /ToUnicode CMaps or use standard
+    encodings so screen readers can read the content.
+    """
+    # Standard encodings that reliably map to Unicode
+    STANDARD_ENCODINGS = {
+        pikepdf.Name("/WinAnsiEncoding"),
+        pikepdf.Name("/MacRomanEncoding"),
+        pikepdf.Name("/MacExpertEncoding"),
+        pikepdf.Name("/StandardEncoding"),
+    }
+    
+    # Type 1 standard fonts that don't need ToUnicode
+    STANDARD_TYPE1_FONTS = {
+        "Courier", "Courier-Bold", "Courier-Oblique", "Courier-BoldOblique",
+        "Helvetica", "Helvetica-Bold", "Helvetica-Oblique", "Helvetica-BoldOblique",
+        "Times-Roman", "Times-Bold", "Times-Italic", "Times-BoldItalic",
+        "Symbol", "ZapfDingbats",
+    }
+    
+    fonts_checked = 0
+    problem_fonts = []
+    
+    for page_num, page in enumerate(pdf.pages, start=1):
+        resources = page.get("/Resources")
+        if not resources:
+            continue
+        
+        font_dict = resources.get("/Font")
+        if not font_dict:
+            continue
+        
+        try:
+            font_dict_obj = font_dict.get_object() if hasattr(font_dict, 'get_object') else font_dict
+        except Exception:
+            continue
+        
+        for font_name, font_ref in font_dict_obj.items():
+            try:
+                font = font_ref.get_object() if hasattr(font_ref, 'get_object') else font_ref
+            except Exception:
+                continue
+            
+            fonts_checked += 1
+            
+            # Check font type
+            subtype = font.get("/Subtype")
+            base_font = str(font.get("/BaseFont", "")).lstrip("/")
+            
+            # Standard Type1 fonts are fine
+            if base_font in STANDARD_TYPE1_FONTS:
+                continue
+            
+            # Type0 (composite) fonts should have ToUnicode
+            if subtype == pikepdf.Name("/Type0"):
+                if "/ToUnicode" not in font:
+                    problem_fonts.append((page_num, font_name, "Type0 missing ToUnicode"))
+                continue
+            
+            # Type1, TrueType, etc.
+            has_tounicode = "/ToUnicode" in font
+            encoding = font.get("/Encoding")
+            has_standard_encoding = encoding in STANDARD_ENCODINGS
+            
+            # Also accept encoding dicts based on standard encodings
+            if not has_standard_encoding and isinstance(encoding, pikepdf.Dictionary):
+                base_encoding = encoding.get("/BaseEncoding")
+                has_standard_encoding = base_encoding in STANDARD_ENCODINGS
+            
+            if not has_tounicode and not has_standard_encoding:
+                problem_fonts.append((page_num, font_name, "no ToUnicode or standard encoding"))
+    
+    if fonts_checked == 0:
+        return "N/A (no fonts found)"
+    
+    if not problem_fonts:
+        return "pass"
+    
+    # Deduplicate by font name and reason
+    unique_issues = {}
+    for pg, name, reason in problem_fonts:
+        key = (name, reason)
+        unique_issues.setdefault(key, []).append(pg)
+    
+    details = "; ".join(f"{name} ({reason})" for (name, reason) in unique_issues.keys())
+    print(f"Fonts with encoding issues: {details}")
+    return "fail"
@@ -0,0 +1,50 @@
+import sys
+
+
+def main(argv=None):
+    # argparse and the checker (which pulls in the check modules and, unless
+    # --backend catalog is used, pikepdf) are imported here rather than at
+    # module load, so importing the CLI stays cheap and `--help` or a usage
+    # error never touches pikepdf.
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Check if a PDF is tagged for accessibility.")
+    parser.add_argument("pdf_file", nargs="+", help="Path to the PDF file(s) to check.")
+    parser.add_argument("--force-bookmark-check", action="store_true", help="Force bookmark check even for single page documents. (normally only on >20 pages)")
+    parser.add_argument("--force-warning", action="store_true", help="Artificially set pages to a high number to trigger a warning for testing. Only triggers when bookmarks exist.")
+    parser.add_argument("--backend", choices=["pikepdf", "catalog"], default="pikepdf", help="Parser backend. 'catalog' is a fast pure-Python reader for triage that only runs the Tagged, Language, Title and Bookmarks checks.")
+    parser.add_argument("--report", help="Append one record per PDF to this report file (.csv for CSV, anything else for NDJSON).")
+    args = parser.parse_args(argv)
+
+    from .checker import check_pdf_accessibility
+
+    writer = None
+    if args.report:
+        from .report import ReportWriter
+        writer = ReportWriter(args.report)
+
+    failed = False
+    try:
+        for pdf_file in args.pdf_file:
+            print(f"Checking accessibility for PDF: {pdf_file}")
+            # One unreadable file shouldn't stop a corpus run; record it and move on
+            try:
+                checklist, details = check_pdf_accessibility(pdf_file, args)
+            except Exception as e:
+                print(f"Error checking PDF file: {e}")
+                failed = True
+                if writer:
+                    writer.write_error(pdf_file, str(e))
+                continue
+            # A rejected row leaves the document out of the report, so fail the run
+            if writer and not writer.write(pdf_file, checklist, details):
+                failed = True
+    finally:
+        if writer:
+            writer.close()
+
+    if failed:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
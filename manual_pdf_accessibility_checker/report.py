@@ -0,0 +1,203 @@
+import argparse
+import csv
+import json
+import os
+from collections import Counter
+
+from .checker import CHECKLIST_ITEMS
+
+# Fixed CSV layout, so rows line up even when optional items only fire on some files
+CSV_COLUMNS = [
+    "file",
+    "error",
+    *(f"{category}/{item}" for category, items in CHECKLIST_ITEMS.items() for item in items),
+    "untagged_annotations",
+]
+
+def result_status(result):
+    """Reduce a checklist result string to its status, e.g. 'pass - ROUGH CHECK ONLY' -> 'pass'."""
+    for status in ("pass", "fail", "Warning", "N/A", "Not implemented"):
+        if result.startswith(status):
+            return status
+    return "other"
+
+def _flatten_checklist(checklist):
+    """Flatten {category: {item: result}} into {"category/item": result}."""
+    return {
+        f"{category}/{item}": result
+        for category, items in checklist.items()
+        for item, result in items.items()
+    }
+
+class ReportWriter:
+    """
+    Append one record per checked PDF to an NDJSON or CSV report.
+
+    Each record is written and flushed as soon as it is produced, so memory
+    use doesn't grow with the number of files checked. Existing reports are
+    appended to, which lets a corpus be checked across several runs.
+
+    CSV reports use the fixed CSV_COLUMNS layout (or, when appending, the
+    header already in the file); items a document doesn't have are left
+    empty, and rows with items missing from the header are rejected.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.is_csv = path.lower().endswith(".csv")
+        needs_header = not os.path.exists(path) or os.path.getsize(path) == 0
+        self._csv_writer = None
+        if self.is_csv:
+            fieldnames = CSV_COLUMNS
+            if not needs_header:
+                with open(path, newline="", encoding="utf-8") as f:
+                    fieldnames = next(csv.reader(f), CSV_COLUMNS)
+            self._file = open(path, "a", newline="", encoding="utf-8")
+            self._csv_writer = csv.DictWriter(self._file, fieldnames=fieldnames, restval="")
+            if needs_header:
+                self._csv_writer.writeheader()
+        else:
+            self._file = open(path, "a", encoding="utf-8")
+
+    def write(self, file_path, checklist, details):
+        """Append the results for a single PDF; return False if the row was rejected."""
+        untagged = details.get("untagged_annotations", {})
+        if self.is_csv:
+            row = {"file": file_path, **_flatten_checklist(checklist)}
+            # One entry per annotation, e.g. "/Link;/Link;/Widget"
+            row["untagged_annotations"] = ";".join(
+                subtype for subtype, pages in untagged.items() for _ in pages
+            )
+            unknown = set(row) - set(self._csv_writer.fieldnames)
+            if unknown:
+                print(f"Not writing {file_path} to {self.path}: columns {sorted(unknown)} are not in its header.")
+                return False
+            self._csv_writer.writerow(row)
+        else:
+            record = {
+                "file": file_path,
+                "results": checklist,
+                "untagged_annotations": untagged,
+            }
+            self._file.write(json.dumps(record) + "\n")
+        self._file.flush()
+        return True
+
+    def write_error(self, file_path, error):
+        """Append a record for a PDF that couldn't be checked."""
+        if self.is_csv:
+            if "error" not in self._csv_writer.fieldnames:
+                print(f"Not writing {file_path} to {self.path}: it has no error column.")
+                return False
+            self._csv_writer.writerow({"file": file_path, "error": error})
+        else:
+            self._file.write(json.dumps({"file": file_path, "error": error}) + "\n")
+        self._file.flush()
+        return True
+
+    def close(self):
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+def _iter_records(path):
+    """
+    Yield (results, untagged_counts) for each record in a report, one at a time.
+
+    Records for files that couldn't be checked yield (None, None).
+    """
+    with open(path, newline="", encoding="utf-8") as f:
+        if path.lower().endswith(".csv"):
+            for row in csv.DictReader(f):
+                if row.pop("error", None):
+                    yield None, None
+                    continue
+                untagged = row.pop("untagged_annotations", "")
+                row.pop("file", None)
+                yield row, Counter(s for s in untagged.split(";") if s)
+        else:
+            for line in f:
+                if not line.strip():
+                    continue
+                record = json.loads(line)
+                if "error" in record:
+                    yield None, None
+                    continue
+                untagged = Counter({
+                    subtype: len(pages)
+                    for subtype, pages in record.get("untagged_annotations", {}).items()
+                })
+                yield _flatten_checklist(record["results"]), untagged
+
+def aggregate_reports(paths):
+    """
+    Compute corpus statistics from one or more report files.
+
+    Records are read one at a time, so only the running counts are held
+    in memory. Returns a dict with the document count, per-check status
+    counts, untagged annotation subtype counts, and the number of files
+    that couldn't be checked.
+    """
+    documents = 0
+    errors = 0
+    status_counts = {}
+    untagged_annotations = Counter()
+    for path in paths:
+        for results, untagged in _iter_records(path):
+            if results is None:
+                errors += 1
+                continue
+            documents += 1
+            for check, result in results.items():
+                # Empty CSV cells are items that didn't apply to this document
+                if not result:
+                    continue
+                status_counts.setdefault(check, Counter())[result_status(result)] += 1
+            untagged_annotations.update(untagged)
+    return {
+        "documents": documents,
+        "status_counts": status_counts,
+        "untagged_annotations": untagged_annotations,
+        "errors": errors,
+    }
+
+def print_summary(summary, top=10):
+    """Print corpus statistics produced by aggregate_reports."""
+    documents = summary["documents"]
+    print(f"Documents: {documents}")
+    if summary["errors"]:
+        print(f"Files that couldn't be checked: {summary['errors']}")
+    if not documents:
+        return
+
+    print("Failure rate by check (of the documents it was evaluated on):")
+    for check, counts in summary["status_counts"].items():
+        # Documents where the check didn't run (e.g. catalog-only rows) don't count
+        evaluated = sum(n for status, n in counts.items() if status not in ("N/A", "Not implemented"))
+        if not evaluated:
+            continue
+        failed = counts["fail"]
+        print(f"  {check}: {failed / evaluated:.1%} ({failed}/{evaluated})")
+
+    print("Most common untagged annotation subtypes:")
+    common = summary["untagged_annotations"].most_common(top)
+    if not common:
+        print("  none")
+    for subtype, count in common:
+        print(f"  {subtype}: {count}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Summarize accessibility reports written by check_pdf.py --report.")
+    parser.add_argument("report_file", nargs="+", help="Path to the NDJSON or CSV report file(s).")
+    parser.add_argument("--top", type=int, default=10, help="Number of untagged annotation subtypes to list.")
+    args = parser.parse_args()
+
+    print_summary(aggregate_reports(args.report_file), top=args.top)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,4 @@
+from manual_pdf_accessibility_checker.report import main
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,176 @@
+"""
+Check that the catalog backend answers the catalog-level questions the same
+way pikepdf does across the ways a PDF's cross-reference data can be laid out.
+"""
+import re
+import types
+
+import pikepdf
+import pytest
+
+from manual_pdf_accessibility_checker.backends import BackendError, open_backend
+from manual_pdf_accessibility_checker.checker import check_pdf_accessibility
+from manual_pdf_accessibility_checker.checks.document import check_for_bookmarks
+
+PAGES = 25
+
+
+def make_pdf(path, **save_options):
+    """Write a tagged PDF with /Lang, a docinfo title, outlines and PAGES pages."""
+    pdf = pikepdf.new()
+    for _ in range(PAGES):
+        pdf.add_blank_page()
+    pdf.Root.Lang = pikepdf.String("en-US")
+    pdf.Root.MarkInfo = pikepdf.Dictionary(Marked=True)
+    pdf.docinfo["/Title"] = "Catalog reader fixture — café"
+    with pdf.open_outline() as outline:
+        for i in range(3):
+            item = pikepdf.OutlineItem(f"Section {i + 1}", i)
+            item.children.append(pikepdf.OutlineItem("Subsection", i))
+            outline.root.append(item)
+    pdf.save(path, **save_options)
+    pdf.close()
+    return path
+
+def append_lang_update(path, lang):
+    """Append an incremental update to path that rewrites the catalog's /Lang."""
+    with pikepdf.open(path) as pdf:
+        pdf.Root.Lang = pikepdf.String(lang)
+        root_num = pdf.Root.objgen[0]
+        catalog = pdf.Root.unparse(resolved=True)
+        trailer = pdf.trailer
+        size = int(trailer.Size)
+        info_num = trailer.Info.objgen[0]
+    with open(path, "rb") as f:
+        data = f.read()
+    prev = int(re.findall(rb"startxref\s+(\d+)", data)[-1])
+    update = bytearray(b"\n")
+    offset = len(data) + len(update)
+    update += b"%d 0 obj\n%s\nendobj\n" % (root_num, catalog)
+    xref = len(data) + len(update)
+    update += b"xref\n%d 1\n%010d 00000 n \n" % (root_num, offset)
+    update += b"trailer\n<< /Size %d /Root %d 0 R /Info %d 0 R /Prev %d >>\n" % (size, root_num, info_num, prev)
+    update += b"startxref\n%d\n%%%%EOF\n" % xref
+    with open(path, "ab") as f:
+        f.write(update)
+    return path
+
+def point_root_at_pages(path):
+    """Corrupt a classic xref so the catalog's entry holds the /Pages object's offset."""
+    with pikepdf.open(path) as pdf:
+        root_num = pdf.Root.objgen[0]
+        pages_num = pdf.Root.Pages.objgen[0]
+    data = bytearray(path.read_bytes())
+    xref = int(re.findall(rb"startxref\s+(\d+)", data)[-1])
+    entries = re.match(rb"xref\s+0 \d+\s+", data[xref:]).end() + xref
+    pages_entry = data[entries + 20 * pages_num:entries + 20 * (pages_num + 1)]
+    data[entries + 20 * root_num:entries + 20 * (root_num + 1)] = pages_entry
+    path.write_bytes(bytes(data))
+    return path
+
+def catalog_answers(pdf):
+    """The values the catalog-only checks depend on, as plain Python values."""
+    return {
+        "lang": str(pdf.Root.Lang) if "/Lang" in pdf.Root else None,
+        "title": str(pdf.docinfo["/Title"]) if pdf.docinfo and "/Title" in pdf.docinfo else None,
+        "marked": bool(pdf.Root.MarkInfo.Marked) if "/MarkInfo" in pdf.Root else None,
+        "bookmarks": check_for_bookmarks(pdf),
+        "page_count": pdf.page_count,
+    }
+
+def both_backends(path):
+    answers = {}
+    for backend in ("pikepdf", "catalog"):
+        pdf = open_backend(backend, str(path))
+        try:
+            answers[backend] = catalog_answers(pdf)
+        finally:
+            pdf.close()
+    return answers
+
+FIXTURES = {
+    "classic": {"object_stream_mode": pikepdf.ObjectStreamMode.disable},
+    "object_streams": {"object_stream_mode": pikepdf.ObjectStreamMode.generate},
+    "linearized": {"linearize": True},
+    "linearized_object_streams": {"linearize": True, "object_stream_mode": pikepdf.ObjectStreamMode.generate},
+}
+
+
+@pytest.mark.parametrize("save_options", FIXTURES.values(), ids=FIXTURES.keys())
+def test_matches_pikepdf(tmp_path, save_options):
+    path = make_pdf(tmp_path / "fixture.pdf", **save_options)
+    answers = both_backends(path)
+    assert answers["catalog"] == answers["pikepdf"]
+    assert answers["catalog"]["lang"] == "en-US"
+    assert answers["catalog"]["page_count"] == PAGES
+    assert answers["catalog"]["bookmarks"] == ("pass", 6)
+
+@pytest.mark.parametrize("mode", [pikepdf.ObjectStreamMode.disable, pikepdf.ObjectStreamMode.generate], ids=["classic", "object_streams"])
+def test_incremental_update(tmp_path, mode):
+    path = append_lang_update(make_pdf(tmp_path / "fixture.pdf", object_stream_mode=mode), "de-DE")
+    answers = both_backends(path)
+    assert answers["catalog"] == answers["pikepdf"]
+    assert answers["catalog"]["lang"] == "de-DE"
+
+def test_encrypted_falls_back_to_pikepdf(tmp_path, capsys):
+    path = make_pdf(tmp_path / "fixture.pdf", encryption=pikepdf.Encryption(owner="owner", user=""))
+    with pytest.raises(BackendError):
+        open_backend("catalog", str(path))
+
+    args = types.SimpleNamespace(force_warning=False, force_bookmark_check=True, backend="catalog")
+    checklist, _ = check_pdf_accessibility(str(path), args)
+    assert "falling back to pikepdf" in capsys.readouterr().out
+    assert checklist["document-level"]["Language"] == "pass"
+    assert checklist["document-level"]["Image-only Pages"] == "N/A (catalog-only backend)"
+    assert checklist["page-level"]["Annotations Tagged"] == "N/A (catalog-only backend)"
+
+def test_dangling_root_raises_backend_error(tmp_path):
+    path = make_pdf(tmp_path / "fixture.pdf", object_stream_mode=pikepdf.ObjectStreamMode.disable)
+    data = path.read_bytes()
+    size = int(re.search(rb"/Size (\d+)", data).group(1))
+    path.write_bytes(re.sub(rb"/Root \d+ 0 R", b"/Root %d 0 R" % (size + 10), data))
+    with pytest.raises(BackendError):
+        open_backend("catalog", str(path))
+
+def test_stale_xref_offset_falls_back_to_pikepdf(tmp_path, capsys):
+    path = make_pdf(tmp_path / "fixture.pdf", object_stream_mode=pikepdf.ObjectStreamMode.disable)
+    point_root_at_pages(path)
+    with pytest.raises(BackendError, match="points at object"):
+        open_backend("catalog", str(path))
+
+    args = types.SimpleNamespace(force_warning=False, force_bookmark_check=True, backend="catalog")
+    checklist, _ = check_pdf_accessibility(str(path), args)
+    assert "falling back to pikepdf" in capsys.readouterr().out
+    assert checklist["document-level"]["Language"] == "pass"
+
+def test_wrong_generation_raises_backend_error(tmp_path):
+    path = make_pdf(tmp_path / "fixture.pdf", object_stream_mode=pikepdf.ObjectStreamMode.disable)
+    data = path.read_bytes()
+    path.write_bytes(re.sub(rb"/Root (\d+) 0 R", rb"/Root \1 1 R", data))
+    with pytest.raises(BackendError):
+        open_backend("catalog", str(path))
+
+def test_reference_to_free_object_is_null(tmp_path):
+    path = tmp_path / "fixture.pdf"
+    with pikepdf.new() as pdf:
+        pdf.add_blank_page()
+        pdf.Root.Lang = pikepdf.String("en-US")
+        pdf.Root.StructTreeRoot = pdf.make_indirect(pikepdf.Dictionary(Type=pikepdf.Name.StructTreeRoot))
+        pdf.save(path, object_stream_mode=pikepdf.ObjectStreamMode.disable)
+    with pikepdf.open(path) as pdf:
+        struct_num = pdf.Root.StructTreeRoot.objgen[0]
+    # Mark the structure tree root's xref entry free, leaving a dangling /StructTreeRoot
+    data = bytearray(path.read_bytes())
+    xref = int(re.findall(rb"startxref\s+(\d+)", data)[-1])
+    entries = re.match(rb"xref\s+0 \d+\s+", data[xref:]).end() + xref
+    data[entries + 20 * struct_num + 17:entries + 20 * struct_num + 18] = b"f"
+    path.write_bytes(bytes(data))
+
+    pdf = open_backend("catalog", str(path))
+    assert "/StructTreeRoot" not in pdf.Root
+    assert pdf.Root.get("/StructTreeRoot") is None
+    pdf.close()
+
+    args = types.SimpleNamespace(force_warning=False, force_bookmark_check=True, backend="catalog")
+    checklist, _ = check_pdf_accessibility(str(path), args)
+    assert checklist["document-level"]["Language"] == "pass"
@@ -0,0 +1,92 @@
+import xml.etree.ElementTree as ET
+
+import pikepdf
+import pytest
+
+from manual_pdf_accessibility_checker.backends import open_backend
+from manual_pdf_accessibility_checker.checks.document import (
+    XmpMetadata,
+    check_document_language,
+    check_document_title,
+)
+
+XMP = b"""<?xpacket begin="" id="W5M0MpCehiHzreSzNTczkc9d"?>
+<x:xmpmeta xmlns:x="adobe:ns:meta/">
+ <rdf:RDF xmlns:rdf="http://www.w3.org/1999/02/22-rdf-syntax-ns#">
+  <rdf:Description rdf:about="" xmlns:dc="http://purl.org/dc/elements/1.1/"
+      xmlns:pdfuaid="http://www.aiim.org/pdfua/ns/id/" pdfuaid:part="1">
+   <dc:title><rdf:Alt><rdf:li xml:lang="x-default">XMP title</rdf:li></rdf:Alt></dc:title>
+   <dc:language><rdf:Bag><rdf:li>en-GB</rdf:li></rdf:Bag></dc:language>
+  </rdf:Description>
+ </rdf:RDF>
+</x:xmpmeta>
+<?xpacket end="w"?>"""
+
+BACKENDS = ["pikepdf", "catalog"]
+
+
+def make_pdf(path, lang=None, title=None, metadata=XMP):
+    pdf = pikepdf.new()
+    pdf.add_blank_page()
+    if lang:
+        pdf.Root.Lang = pikepdf.String(lang)
+    if title:
+        pdf.docinfo["/Title"] = title
+    if isinstance(metadata, bytes):
+        pdf.Root.Metadata = pdf.make_stream(metadata, Type=pikepdf.Name.Metadata, Subtype=pikepdf.Name.XML)
+    elif metadata is not None:
+        pdf.Root.Metadata = metadata
+    # Don't let pikepdf rewrite the XMP (it fails on a non-stream /Metadata)
+    pdf.save(path, fix_metadata_version=False)
+    pdf.close()
+    return str(path)
+
+@pytest.fixture
+def count_parses(monkeypatch):
+    """Count XMP parses by wrapping ElementTree.fromstring."""
+    calls = []
+    fromstring = ET.fromstring
+    monkeypatch.setattr(ET, "fromstring", lambda data: calls.append(data) or fromstring(data))
+    return calls
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_docinfo_and_lang_skip_xmp(tmp_path, backend, count_parses):
+    pdf = open_backend(backend, make_pdf(tmp_path / "f.pdf", lang="en-US", title="Docinfo title"))
+    xmp = XmpMetadata(pdf)
+    assert check_document_language(pdf, xmp) == "pass"
+    assert check_document_title(pdf, xmp) == "pass"
+    assert "_root" not in xmp.__dict__
+    assert count_parses == []
+    pdf.close()
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_falls_back_to_xmp_and_parses_once(tmp_path, backend, count_parses):
+    pdf = open_backend(backend, make_pdf(tmp_path / "f.pdf"))
+    xmp = XmpMetadata(pdf)
+    assert check_document_language(pdf, xmp) == "Warning (language only in XMP metadata, /Lang not set; claims PDF/UA-1)"
+    assert check_document_title(pdf, xmp) == "pass (claims PDF/UA-1)"
+    assert xmp.title == "XMP title"
+    assert xmp.languages == ["en-GB"]
+    assert len(count_parses) == 1
+    pdf.close()
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_pdfua_claim_noted_on_failure(tmp_path, backend):
+    xmp = XMP.replace(b"<dc:title><rdf:Alt><rdf:li xml:lang=\"x-default\">XMP title</rdf:li></rdf:Alt></dc:title>", b"")
+    pdf = open_backend(backend, make_pdf(tmp_path / "f.pdf", lang="en-US", metadata=xmp))
+    assert check_document_title(pdf) == "fail (claims PDF/UA-1)"
+    pdf.close()
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_metadata_not_a_stream(tmp_path, backend):
+    pdf = open_backend(backend, make_pdf(tmp_path / "f.pdf", metadata=pikepdf.Dictionary(Type=pikepdf.Name.Metadata)))
+    assert check_document_title(pdf) == "fail"
+    assert check_document_language(pdf) == "fail"
+    pdf.close()
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_unparseable_xmp(tmp_path, backend):
+    pdf = open_backend(backend, make_pdf(tmp_path / "f.pdf", metadata=b"<x:xmpmeta"))
+    assert check_document_title(pdf) == "fail"
+    pdf.close()
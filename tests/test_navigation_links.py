@@ -0,0 +1,38 @@
+import pikepdf
+
+from manual_pdf_accessibility_checker.checks.page import check_navigation_links
+
+
+def make_pdf(link_rects, **link_target):
+    """Build an in-memory PDF with one page per entry, each with links at the given /Rects."""
+    pdf = pikepdf.new()
+    for rects in link_rects:
+        pdf.add_blank_page()
+        pdf.pages[-1].Annots = pdf.make_indirect(pikepdf.Array([
+            pdf.make_indirect(pikepdf.Dictionary(
+                Type=pikepdf.Name.Annot,
+                Subtype=pikepdf.Name.Link,
+                Rect=rect,
+                **(link_target or {"A": pikepdf.Dictionary(S=pikepdf.Name.URI, URI=pikepdf.String("https://example.com"))}),
+            ))
+            for rect in rects
+        ]))
+    return pdf
+
+NAV_BAR = [pikepdf.Array([0, 0, 50, 10]), pikepdf.Array([60, 0, 110, 10])]
+
+
+def test_repeated_links_warn():
+    assert check_navigation_links(make_pdf([NAV_BAR, NAV_BAR, NAV_BAR])) == "Warning (repeated navigation links on 3 pages)"
+
+def test_distinct_links_pass():
+    assert check_navigation_links(make_pdf([NAV_BAR[:1], NAV_BAR[1:]])) == "pass"
+
+def test_malformed_rect_is_skipped():
+    bad_rect = pikepdf.Array([pikepdf.Name.Top, 0, 50, 10])
+    pdf = make_pdf([NAV_BAR + [bad_rect], NAV_BAR, [bad_rect]])
+    assert check_navigation_links(pdf) == "Warning (repeated navigation links on 2 pages)"
+
+def test_non_object_targets():
+    assert check_navigation_links(make_pdf([NAV_BAR, NAV_BAR], Dest=3)) == "Warning (repeated navigation links on 2 pages)"
+    assert check_navigation_links(make_pdf([NAV_BAR[:1], NAV_BAR[1:]], A=True)) == "pass"
@@ -0,0 +1,112 @@
+import csv
+import json
+import types
+
+import pikepdf
+import pytest
+
+from manual_pdf_accessibility_checker.checker import check_pdf_accessibility
+from manual_pdf_accessibility_checker.cli import main as cli_main
+from manual_pdf_accessibility_checker.report import (
+    CSV_COLUMNS,
+    ReportWriter,
+    _flatten_checklist,
+    aggregate_reports,
+    print_summary,
+)
+
+
+def checklist(image_only, encoding):
+    return {
+        "document-level": {"Image-only Pages": image_only, "Tagged": "pass"},
+        "page-level": {"Character Encoding": encoding, "Multimedia Tagged": "Not implemented"},
+    }
+
+FULL = checklist("fail", "fail")
+CATALOG = checklist("N/A (catalog-only backend)", "N/A (catalog-only backend)")
+UNTAGGED = {"untagged_annotations": {"/Link": [1, 2], "/Widget": [3]}}
+
+
+def write_records(path):
+    """Write two checked documents and an error, then append a third document in a new writer."""
+    with ReportWriter(str(path)) as writer:
+        assert writer.write("a.pdf", FULL, UNTAGGED)
+        assert writer.write("b.pdf", CATALOG, {})
+        assert writer.write_error("broken.pdf", "object 9 not found")
+    with ReportWriter(str(path)) as writer:
+        assert writer.write("c.pdf", checklist("pass", "pass"), {"untagged_annotations": {"/Link": [4]}})
+
+@pytest.mark.parametrize("name", ["report.ndjson", "report.csv"])
+def test_round_trip(tmp_path, name):
+    path = tmp_path / name
+    write_records(path)
+    summary = aggregate_reports([str(path)])
+
+    assert summary["documents"] == 3
+    assert summary["errors"] == 1
+    assert summary["untagged_annotations"] == {"/Link": 3, "/Widget": 1}
+    counts = summary["status_counts"]
+    assert counts["document-level/Image-only Pages"] == {"fail": 1, "N/A": 1, "pass": 1}
+    assert counts["document-level/Tagged"] == {"pass": 3}
+    # Items a document doesn't have (empty CSV cells) aren't counted
+    assert "document-level/Bookmarks Count" not in counts
+
+def test_csv_header_written_once(tmp_path):
+    path = tmp_path / "report.csv"
+    write_records(path)
+    with open(path, newline="", encoding="utf-8") as f:
+        rows = list(csv.reader(f))
+    assert rows[0] == CSV_COLUMNS
+    assert [row[0] for row in rows[1:]] == ["a.pdf", "b.pdf", "broken.pdf", "c.pdf"]
+
+def test_csv_append_reuses_existing_header(tmp_path, capsys):
+    path = tmp_path / "report.csv"
+    path.write_text("file,document-level/Image-only Pages,document-level/Tagged\n", encoding="utf-8")
+    with ReportWriter(str(path)) as writer:
+        # Rows with columns the header lacks are rejected rather than misaligned
+        assert not writer.write("a.pdf", FULL, {})
+        assert not writer.write_error("broken.pdf", "boom")
+    assert "not in its header" in capsys.readouterr().out
+    assert path.read_text(encoding="utf-8").count("\n") == 1
+
+def test_ndjson_error_record(tmp_path):
+    path = tmp_path / "report.ndjson"
+    with ReportWriter(str(path)) as writer:
+        writer.write_error("broken.pdf", "boom")
+    assert json.loads(path.read_text(encoding="utf-8")) == {"file": "broken.pdf", "error": "boom"}
+
+def test_failure_rate_excludes_unevaluated(tmp_path, capsys):
+    path = tmp_path / "report.ndjson"
+    write_records(path)
+    print_summary(aggregate_reports([str(path)]))
+    out = capsys.readouterr().out
+    # b.pdf is catalog-only, so Image-only Pages was evaluated on two documents
+    assert "document-level/Image-only Pages: 50.0% (1/2)" in out
+    assert "Multimedia Tagged" not in out
+
+
+def make_pdf(path):
+    pdf = pikepdf.new()
+    pdf.add_blank_page()
+    pdf.Root.Lang = pikepdf.String("en-US")
+    with pdf.open_outline() as outline:
+        outline.root.append(pikepdf.OutlineItem("Only bookmark", 0))
+    pdf.save(path)
+    pdf.close()
+    return path
+
+@pytest.mark.parametrize("backend", ["pikepdf", "catalog"])
+def test_checklist_matches_csv_columns(tmp_path, backend):
+    path = make_pdf(tmp_path / "fixture.pdf")
+    # force_warning makes the optional Bookmarks Count item fire
+    args = types.SimpleNamespace(force_warning=True, force_bookmark_check=True, backend=backend)
+    results, _ = check_pdf_accessibility(str(path), args)
+    assert list(_flatten_checklist(results)) == [c for c in CSV_COLUMNS if "/" in c]
+
+def test_cli_fails_when_report_row_rejected(tmp_path):
+    path = make_pdf(tmp_path / "fixture.pdf")
+    report = tmp_path / "report.csv"
+    report.write_text("file,error\n", encoding="utf-8")
+    with pytest.raises(SystemExit) as exc:
+        cli_main([str(path), "--report", str(report)])
+    assert exc.value.code == 1